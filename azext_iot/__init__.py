@@ -4,46 +4,67 @@
 # Licensed under the MIT License. See License.txt in the project root for license information.
 # --------------------------------------------------------------------------------------------
 
-from azure.cli.core import AzCommandsLoader
-from azure.cli.core.commands import CliCommandType
-from azext_iot._factory import iot_service_provisioning_factory
-from azext_iot._constants import VERSION
-import azext_iot._help  # pylint: disable=unused-import
+__all__ = ('COMMAND_LOADER_CLS', '__version__')
 
+# Legacy module attributes, served lazily via commands._ops for callers that
+# still do `from azext_iot import iothub_ops` and friends.
+_OPS_ATTRS = {
+    'iothub_ops': 'hub',
+    'iotdps_ops': 'dps',
+    'iotdigitaltwin_ops': 'digitaltwin',
+    'iotpnp_ops': 'pnp',
+}
 
-iothub_ops = CliCommandType(
-    operations_tmpl='azext_iot.operations.hub#{}'
-)
+# _help registration is deferred until a parser/help view is actually built.
+_help_loaded = False
 
-iotdps_ops = CliCommandType(
-    operations_tmpl='azext_iot.operations.dps#{}',
-    client_factory=iot_service_provisioning_factory
-)
 
-iotdigitaltwin_ops = CliCommandType(
-    operations_tmpl='azext_iot.operations.digitaltwin#{}'
-)
+def _build_commands_loader_cls():
+    from azure.cli.core import AzCommandsLoader
 
-iotpnp_ops = CliCommandType(
-    operations_tmpl='azext_iot.operations.pnp#{}'
-)
+    class IoTExtCommandsLoader(AzCommandsLoader):
 
+        def __init__(self, cli_ctx=None):
+            super(IoTExtCommandsLoader, self).__init__(cli_ctx=cli_ctx)
+            self._ctable_loaded = False
+            self._loaded_arg_commands = set()
 
-class IoTExtCommandsLoader(AzCommandsLoader):
+        def load_command_table(self, args):
+            # The table is deterministic per loader; skip rebuilds in
+            # long-lived processes such as `az interactive`.
+            if not self._ctable_loaded:
+                from azext_iot.commands import load_command_table
+                load_command_table(self, args)
+                self._ctable_loaded = True
+            return self.command_table
 
-    def __init__(self, cli_ctx=None):
-        super(IoTExtCommandsLoader, self).__init__(cli_ctx=cli_ctx)
+        def load_arguments(self, command):
+            global _help_loaded  # pylint: disable=global-statement
+            if not _help_loaded:
+                import azext_iot._help  # pylint: disable=unused-import
+                _help_loaded = True
+            if command not in self._loaded_arg_commands:
+                from azext_iot._params import load_arguments
+                load_arguments(self, command)
+                self._loaded_arg_commands.add(command)
 
-    def load_command_table(self, args):
-        from azext_iot.commands import load_command_table
-        load_command_table(self, args)
-        return self.command_table
+    return IoTExtCommandsLoader
 
-    def load_arguments(self, command):
-        from azext_iot._params import load_arguments
-        load_arguments(self, command)
 
-
-COMMAND_LOADER_CLS = IoTExtCommandsLoader
-
-__version__ = VERSION
+def __getattr__(name):
+    # PEP 562 - define the commands loader only when the CLI asks for it.
+    if name in ('IoTExtCommandsLoader', 'COMMAND_LOADER_CLS'):
+        loader_cls = _build_commands_loader_cls()
+        globals()['IoTExtCommandsLoader'] = loader_cls
+        globals()['COMMAND_LOADER_CLS'] = loader_cls
+        return loader_cls
+    if name == '__version__':
+        from azext_iot._constants import VERSION
+        globals()['__version__'] = VERSION
+        return VERSION
+    if name in _OPS_ATTRS:
+        from azext_iot.commands import _ops
+        value = _ops(_OPS_ATTRS[name])
+        globals()[name] = value
+        return value
+    raise AttributeError("module {} has no attribute {}".format(__name__, name))
@@ -0,0 +1,139 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+
+"""
+CLI parameter definitions.
+
+The argument specs are split per command group; load_arguments imports and
+replays only the submodule(s) matching the invoked scope.
+"""
+
+import pickle
+import pkgutil
+import threading
+import weakref
+from importlib import import_module
+
+from azext_iot._params import _common
+from azext_iot._params._common import (  # noqa: F401 pylint: disable=unused-import
+    ArgSpec,
+    event_msg_prop_type,
+    hub_name_type,
+)
+
+_SHARED_NAMES = frozenset([
+    'EntityStatusType',
+    'SettleType',
+    'DeviceAuthType',
+    'KeyType',
+    'AttestationType',
+    'ProtocolType',
+    'AckType',
+    'MetricType',
+    'ReprovisionType',
+    'AllocationType',
+    'DistributedTracingSamplingModeType',
+    'ModelSourceType',
+])
+
+# Second command token -> spec submodule. _common always applies.
+_GROUP_MODULES = {
+    'hub': '_hub',
+    'device': '_device',
+    'edge': '_edge',
+    'dps': '_dps',
+    'dt': '_dt',
+    'pnp': '_pnp',
+}
+
+_MANIFEST_FILE = 'params_manifest.pkl'
+_manifest = None
+_manifest_checked = False
+
+# Loader -> set of command scopes already registered; repeated parser
+# builds within one process skip straight through. '' marks a full
+# (unscoped) registration which covers every later command.
+_LOAD_ARGS_DONE = weakref.WeakKeyDictionary()
+_LOAD_ARGS_LOCK = threading.Lock()
+
+
+def __getattr__(name):
+    # PEP 562 - keep `from azext_iot._params import KeyType` style imports
+    # working without loading common.shared eagerly.
+    if name in _SHARED_NAMES:
+        import azext_iot.common.shared as shared
+        value = getattr(shared, name)
+        globals()[name] = value
+        return value
+    raise AttributeError("module {} has no attribute {}".format(__name__, name))
+
+
+def _load_manifest():
+    """
+    Load the argument-spec manifest frozen at build time by
+    scripts/gen_params_manifest.py. Returns None when not shipped, in which
+    case the spec submodules are replayed directly.
+    """
+    try:
+        data = pkgutil.get_data('azext_iot', _MANIFEST_FILE)
+    except (OSError, IOError):
+        data = None
+    if not data:
+        return None
+    try:
+        return pickle.loads(data)
+    except Exception:  # pylint: disable=broad-except
+        return None
+
+
+def _scope_applies(scope, command):
+    scope_parts = scope.split()
+    command_parts = command.split()
+    return (command_parts[:len(scope_parts)] == scope_parts or
+            scope_parts[:len(command_parts)] == command_parts)
+
+
+def _iter_specs(command):
+    global _manifest, _manifest_checked  # pylint: disable=global-statement
+    if not _manifest_checked:
+        _manifest = _load_manifest()
+        _manifest_checked = True
+    if _manifest is not None:
+        for scope, entries in _manifest.items():
+            yield scope, entries
+        return
+    tokens = command.split()
+    group = tokens[1] if len(tokens) > 1 and tokens[0] == 'iot' else None
+    if group in _GROUP_MODULES:
+        names = (_GROUP_MODULES[group],)
+    else:
+        names = tuple(_GROUP_MODULES.values())
+    for scope, entries in _common.SPECS.items():
+        yield scope, entries
+    for name in names:
+        module = import_module('azext_iot._params.' + name)
+        for scope, entries in module.SPECS.items():
+            yield scope, entries
+
+
+def load_arguments(self, command):
+    """
+    Load CLI Args for Knack parser.
+
+    `command` is the command string core is building a parser for; when
+    falsy (help views, tab-completion) every group is registered.
+    """
+    command = (command or '').strip()
+    with _LOAD_ARGS_LOCK:
+        done = _LOAD_ARGS_DONE.setdefault(self, set())
+        if '' in done or command in done:
+            return
+        done.add(command)
+    for scope, entries in _iter_specs(command):
+        if command and not _scope_applies(scope, command):
+            continue
+        with self.argument_context(scope) as context:
+            _common._replay(context, entries, _common._apply)  # pylint: disable=protected-access
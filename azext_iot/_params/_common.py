@@ -0,0 +1,235 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+
+"""
+Shared argument types, spec helpers and root 'iot' specs for azext_iot._params.
+"""
+
+import sys
+from collections import namedtuple
+from functools import lru_cache
+
+from knack.arguments import CLIArgumentType, CaseInsensitiveList
+from azure.cli.core.commands.parameters import (
+    resource_group_name_type,
+    get_enum_type,
+    get_three_state_flag
+)
+
+
+@lru_cache(maxsize=None)
+def _enum(enum_name):
+    """
+    Cache get_enum_type results by common.shared enum name - the same enums
+    recur across command groups and cannot change at runtime. Keyed by name
+    so common.shared is only imported when a group actually needs an enum.
+    """
+    import azext_iot.common.shared as shared
+    return get_enum_type(getattr(shared, enum_name))
+
+
+_TSF = get_three_state_flag()
+
+
+def _login_validator(cmd, namespace):
+    # Thunk so _validators is only imported during argument post-parse,
+    # not on every CLI invocation.
+    from azext_iot._validators import mode2_iot_login_handler
+    return mode2_iot_login_handler(cmd, namespace)
+
+
+def _hub_name_completer(*args, **kwargs):
+    # Resolved on tab-completion only, keeping the completion-list machinery
+    # off the cold startup path.
+    from azure.cli.core.commands.parameters import get_resource_name_completion_list
+    return get_resource_name_completion_list('Microsoft.Devices/IotHubs')(*args, **kwargs)
+
+
+class _FrozenCIList(CaseInsensitiveList):
+    """
+    CaseInsensitiveList over a fixed choice set with O(1) membership.
+    """
+
+    __slots__ = ('_set',)
+
+    def __init__(self, items):
+        super(_FrozenCIList, self).__init__(items)
+        self._set = frozenset(item.lower() for item in items)
+
+    def __contains__(self, other):
+        return other.lower() in self._set
+
+
+hub_name_type = CLIArgumentType(
+    completer=_hub_name_completer,
+    help='IoT Hub name.')
+
+event_msg_prop_type = CLIArgumentType(
+    nargs='*',
+    choices=_FrozenCIList(['sys', 'app', 'anno', 'all']),
+    help='Indicate key message properties to output. '
+    'sys = system properties, app = application properties, anno = annotations'
+)
+
+
+# Recurring option lists and help strings, shared across argument specs so
+# each literal is allocated (and interned) once per process.
+_OPTS_TOP = ('--top',)
+_OPTS_PROPS = ('--properties', '--props', '-p')
+_OPTS_POLICY_NAME = ('--policy-name', '--pn')
+_OPTS_CONTENT = ('--content', '-k')
+_OPTS_CONTENT_TYPE = ('--content-type', '--ct')
+_OPTS_TARGET_CONDITION = ('--target-condition', '--tc', '-t')
+_OPTS_PRIORITY = ('--priority', '--pri')
+_OPTS_METRICS = ('--metrics', '-m')
+_OPTS_LABELS = ('--labels', '--lab')
+_OPTS_FORCE = ('--force', '-f')
+_OPTS_CHILD_LIST = ('--child-list', '--cl')
+_OPTS_CERT_PATH = ('--certificate-path', '--cp')
+_OPTS_SECONDARY_CERT_PATH = ('--secondary-certificate-path', '--scp')
+_OPTS_PRIMARY_KEY = ('--primary-key', '--pk')
+_OPTS_SECONDARY_KEY = ('--secondary-key', '--sk')
+_OPTS_ENDORSEMENT_KEY = ('--endorsement-key', '--ek')
+_OPTS_INTERFACE = ('--interface', '-i')
+_OPTS_DEFINITION = ('--definition', '--def')
+_OPTS_SEARCH = ('--search', '--ss')
+
+_HELP_FORCE_PARENT = sys.intern("Overwrites the non-edge device's parent device.")
+_HELP_CHILD_LIST = sys.intern('Child device list (comma separated) includes only non-edge devices.')
+_HELP_EDGE_DEVICE_ID = sys.intern('Id of edge device.')
+_HELP_NON_EDGE_DEVICE_ID = sys.intern('Id of non-edge device.')
+_HELP_ENROLLMENT_GROUP_ID = sys.intern('ID of enrollment group')
+_HELP_PRIMARY_KEY = sys.intern('The primary symmetric shared access key stored in base64 format. ')
+_HELP_SECONDARY_KEY = sys.intern('The secondary symmetric shared access key stored in base64 format. ')
+_HELP_CONSUMER_GROUP = sys.intern('Specify the consumer group to use when connecting to event hub endpoint.')
+_HELP_REPAIR = sys.intern('Reinstall uamqp dependency compatible with extension version. Default: false')
+
+ArgSpec = namedtuple('ArgSpec', ['name', 'opts', 'arg_type', 'help', 'validator', 'type', 'group'])
+ArgSpec.__new__.__defaults__ = (None,) * 6
+
+# ArgSpec field -> context.argument keyword
+_FIELD_KWARGS = (
+    ('opts', 'options_list'),
+    ('arg_type', 'arg_type'),
+    ('help', 'help'),
+    ('validator', 'validator'),
+    ('type', 'type'),
+    ('group', 'arg_group'),
+)
+
+
+# Objects that cannot live in the serialized manifest; entries reference them
+# as ('$ref', name) and are resolved here during replay.
+def _refs():
+    return {
+        '_TSF': _TSF,
+        '_login_validator': _login_validator,
+        'hub_name_type': hub_name_type,
+        'event_msg_prop_type': event_msg_prop_type,
+        'resource_group_name_type': resource_group_name_type,
+        'int': int,
+    }
+
+
+try:
+    # optional compiled hot loop; see _params_replay.pyx
+    from azext_iot._params_replay import replay as _replay
+except ImportError:
+    def _replay(context, entries, apply_fn):
+        for spec in entries:
+            apply_fn(context, spec)
+
+
+def _apply(context, spec):
+    kwargs = {}
+    for field, kwarg in _FIELD_KWARGS:
+        value = getattr(spec, field)
+        if value is None:
+            continue
+        if isinstance(value, tuple) and len(value) == 2 and value[0] == '$ref':
+            value = _refs()[value[1]]
+        if kwarg == 'arg_type' and isinstance(value, str):
+            value = _enum(value)
+        kwargs[kwarg] = value
+    context.argument(spec.name, **kwargs)
+
+
+# Shared arguments registered for every iot command.
+SPECS = {
+    'iot': (
+        ArgSpec('login',
+                opts=('--login', '-l'),
+                validator=_login_validator,
+                help='This command supports an entity connection string with rights to perform action. Use '
+                     'to avoid session login via "az login". If both an entity connection string and name '
+                     'are provided the connection string takes priority.'),
+        ArgSpec('resource_group_name',
+                arg_type=resource_group_name_type),
+        ArgSpec('hub_name',
+                opts=('--hub-name', '-n'),
+                arg_type=hub_name_type),
+        ArgSpec('device_id',
+                opts=('--device-id', '-d'),
+                help='Target Device.'),
+        ArgSpec('module_id',
+                opts=('--module-id', '-m'),
+                help='Target Module.'),
+        ArgSpec('key_type',
+                opts=('--key-type', '--kt'),
+                arg_type='KeyType',
+                help='Shared access policy key type for auth.'),
+        ArgSpec('policy_name',
+                opts=_OPTS_POLICY_NAME,
+                help='Shared access policy to use for auth.'),
+        ArgSpec('duration',
+                opts=('--duration', '--du'),
+                type=int,
+                help='Valid token duration in seconds.'),
+        ArgSpec('etag',
+                opts=('--etag', '-e'),
+                help='Entity tag value.'),
+        ArgSpec('top',
+                type=int,
+                opts=_OPTS_TOP,
+                help='Maximum number of elements to return. Use -1 for unlimited.'),
+        ArgSpec('method_name',
+                opts=('--method-name', '--mn'),
+                help='Target method for invocation.'),
+        ArgSpec('method_payload',
+                opts=('--method-payload', '--mp'),
+                help='Json payload to be passed to method. Must be file path or raw json.'),
+        ArgSpec('timeout',
+                opts=('--timeout', '--to'),
+                type=int,
+                help='Maximum number of seconds to wait for method result.'),
+        ArgSpec('auth_method',
+                opts=('--auth-method', '--am'),
+                arg_type='DeviceAuthType',
+                help='The authorization type an entity is to be created with.'),
+        ArgSpec('metric_type',
+                opts=('--metric-type', '--mt'),
+                arg_type='MetricType',
+                help='Indicates which metric collection should be used to lookup a metric.'),
+        ArgSpec('metric_id',
+                opts=('--metric-id', '-m'),
+                help='Target metric for evaluation.'),
+        ArgSpec('yes',
+                opts=('--yes', '-y'),
+                arg_type=_TSF,
+                help='Skip user prompts. Indicates acceptance of dependency installation (if required). '
+                     'Used primarily for automation scenarios. Default: false'),
+        ArgSpec('repair',
+                opts=('--repair', '-r'),
+                arg_type=_TSF,
+                help=_HELP_REPAIR),
+        ArgSpec('repo_endpoint',
+                opts=('--endpoint', '-e'),
+                help='IoT Plug and Play endpoint.'),
+        ArgSpec('repo_id',
+                opts=('--repo-id', '-r'),
+                help='IoT Plug and Play repository Id.'),
+    ),
+}
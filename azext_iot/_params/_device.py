@@ -0,0 +1,75 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+
+"""
+Argument specs for iot device command groups.
+"""
+
+from azext_iot._params._common import (
+    ArgSpec,
+    _TSF,
+    _OPTS_CONTENT_TYPE,
+    _OPTS_PROPS,
+)
+
+SPECS = {
+    'iot device': (
+        ArgSpec('data',
+                opts=('--data', '--da'),
+                help='Message body.'),
+        ArgSpec('properties',
+                opts=_OPTS_PROPS,
+                help='Message property bag in key-value pairs with the following format: a=b;c=d'),
+        ArgSpec('msg_count',
+                opts=('--msg-count', '--mc'),
+                type=int,
+                help='Number of device messages to send to IoT Hub.'),
+        ArgSpec('msg_interval',
+                opts=('--msg-interval', '--mi'),
+                type=int,
+                help='Delay in seconds between device-to-cloud messages.'),
+        ArgSpec('receive_settle',
+                opts=('--receive-settle', '--rs'),
+                arg_type='SettleType',
+                help='Indicates how to settle received cloud-to-device messages. Supported with HTTP only.'),
+        ArgSpec('protocol_type',
+                opts=('--protocol', '--proto'),
+                arg_type='ProtocolType',
+                help='Indicates device-to-cloud message protocol'),
+    ),
+    'iot device c2d-message': (
+        ArgSpec('ack',
+                opts=('--ack',),
+                arg_type='AckType',
+                help='Request the delivery of per-message feedback regarding the final state of that '
+                     'message. The description of ack values is as follows. Positive: If the c2d message '
+                     'reaches the Completed state, IoT Hub generates a feedback message. Negative: If the '
+                     'c2d message reaches the Dead lettered state, IoT Hub generates a feedback message. '
+                     'Full: IoT Hub generates a feedback message in either case. By default, no ack is '
+                     'requested.'),
+        ArgSpec('correlation_id',
+                opts=('--correlation-id', '--cid'),
+                help='Correlation Id associated with message.'),
+        ArgSpec('lock_timeout',
+                opts=('--lock-timeout', '--lt'),
+                type=int,
+                help='Specifies the amount of time a message will be invisible to other receive calls.'),
+    ),
+    'iot device c2d-message send': (
+        ArgSpec('wait_on_feedback',
+                opts=('--wait', '-w'),
+                arg_type=_TSF,
+                help='If set the c2d send operation will block until device feedback has been received.'),
+    ),
+    'iot device upload-file': (
+        ArgSpec('file_path',
+                opts=('--file-path', '--fp'),
+                help='Path to file for upload.'),
+        ArgSpec('content_type',
+                opts=_OPTS_CONTENT_TYPE,
+                help='MIME Type of file.'),
+    ),
+}
@@ -0,0 +1,136 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+
+"""
+Argument specs for iot dps command groups.
+"""
+
+from azext_iot._params._common import (
+    ArgSpec,
+    _TSF,
+    _OPTS_CERT_PATH,
+    _OPTS_ENDORSEMENT_KEY,
+    _OPTS_PRIMARY_KEY,
+    _OPTS_SECONDARY_CERT_PATH,
+    _OPTS_SECONDARY_KEY,
+    _HELP_ENROLLMENT_GROUP_ID,
+    _HELP_PRIMARY_KEY,
+    _HELP_SECONDARY_KEY,
+)
+
+SPECS = {
+    'iot dps': (
+        ArgSpec('dps_name',
+                help='Name of the Azure IoT Hub device provisioning service'),
+        ArgSpec('initial_twin_properties',
+                opts=('--initial-twin-properties', '--props'),
+                help='Initial twin properties'),
+        ArgSpec('initial_twin_tags',
+                opts=('--initial-twin-tags', '--tags'),
+                help='Initial twin tags'),
+        ArgSpec('iot_hub_host_name',
+                opts=('--iot-hub-host-name', '--hn'),
+                help='Host name of target IoT Hub'),
+        ArgSpec('provisioning_status',
+                opts=('--provisioning-status', '--ps'),
+                arg_type='EntityStatusType',
+                help='Enable or disable enrollment entry'),
+        ArgSpec('certificate_path',
+                opts=_OPTS_CERT_PATH,
+                help='The path to the file containing the primary certificate.'),
+        ArgSpec('secondary_certificate_path',
+                opts=_OPTS_SECONDARY_CERT_PATH,
+                help='The path to the file containing the secondary certificate'),
+        ArgSpec('remove_certificate',
+                opts=('--remove-certificate', '--rc'),
+                help='Remove current primary certificate',
+                arg_type=_TSF),
+        ArgSpec('remove_secondary_certificate',
+                opts=('--remove-secondary-certificate', '--rsc'),
+                help='Remove current secondary certificate',
+                arg_type=_TSF),
+        ArgSpec('reprovision_policy',
+                opts=('--reprovision-policy', '--rp'),
+                arg_type='ReprovisionType',
+                help='Device data to be handled on re-provision to different Iot Hub.'),
+        ArgSpec('allocation_policy',
+                opts=('--allocation-policy', '--ap'),
+                arg_type='AllocationType',
+                help='Type of allocation for device assigned to the Hub.'),
+        ArgSpec('iot_hubs',
+                opts=('--iot-hubs', '--ih'),
+                help='Host name of target IoT Hub. Use space-separated list for multiple IoT Hubs.'),
+    ),
+    'iot dps enrollment': (
+        ArgSpec('enrollment_id',
+                help='ID of device enrollment record'),
+        ArgSpec('device_id',
+                help='IoT Hub Device ID'),
+        ArgSpec('primary_key',
+                opts=_OPTS_PRIMARY_KEY,
+                help=_HELP_PRIMARY_KEY),
+        ArgSpec('secondary_key',
+                opts=_OPTS_SECONDARY_KEY,
+                help=_HELP_SECONDARY_KEY),
+    ),
+    'iot dps enrollment create': (
+        ArgSpec('attestation_type',
+                opts=('--attestation-type', '--at'),
+                arg_type='AttestationType',
+                help='Attestation Mechanism'),
+        ArgSpec('certificate_path',
+                opts=_OPTS_CERT_PATH,
+                help='The path to the file containing the primary certificate. When choosing x509 as '
+                     'attestation type, one of the certificate path is required.'),
+        ArgSpec('secondary_certificate_path',
+                opts=_OPTS_SECONDARY_CERT_PATH,
+                help='The path to the file containing the secondary certificate. When choosing x509 as '
+                     'attestation type, one of the certificate path is required.'),
+        ArgSpec('endorsement_key',
+                opts=_OPTS_ENDORSEMENT_KEY,
+                help='TPM endorsement key for a TPM device. When choosing tpm as attestation type, '
+                     'endorsement key is required.'),
+    ),
+    'iot dps enrollment update': (
+        ArgSpec('endorsement_key',
+                opts=_OPTS_ENDORSEMENT_KEY,
+                help='TPM endorsement key for a TPM device.'),
+    ),
+    'iot dps enrollment-group': (
+        ArgSpec('enrollment_id',
+                help=_HELP_ENROLLMENT_GROUP_ID),
+        ArgSpec('primary_key',
+                opts=_OPTS_PRIMARY_KEY,
+                help=_HELP_PRIMARY_KEY),
+        ArgSpec('secondary_key',
+                opts=_OPTS_SECONDARY_KEY,
+                help=_HELP_SECONDARY_KEY),
+        ArgSpec('certificate_path',
+                opts=_OPTS_CERT_PATH,
+                help='The path to the file containing the primary certificate. If attestation with an '
+                     'intermediate certificate is desired then a certificate path must be provided.'),
+        ArgSpec('secondary_certificate_path',
+                opts=_OPTS_SECONDARY_CERT_PATH,
+                help='The path to the file containing the secondary certificate. If attestation with an '
+                     'intermediate certificate is desired then a certificate path must be provided.'),
+        ArgSpec('root_ca_name',
+                opts=('--root-ca-name', '--ca-name', '--cn'),
+                help='The name of the primary root CA certificate. If attestation with a root CA '
+                     'certificate is desired then a root ca name must be provided.'),
+        ArgSpec('secondary_root_ca_name',
+                opts=('--secondary-root-ca-name', '--secondary-ca-name', '--scn'),
+                help='The name of the secondary root CA certificate. If attestation with a root CA '
+                     'certificate is desired then a root ca name must be provided.'),
+    ),
+    'iot dps registration': (
+        ArgSpec('registration_id',
+                help='ID of device registration'),
+    ),
+    'iot dps registration list': (
+        ArgSpec('enrollment_id',
+                help=_HELP_ENROLLMENT_GROUP_ID),
+    ),
+}
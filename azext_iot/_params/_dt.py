@@ -0,0 +1,62 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+
+"""
+Argument specs for iot dt command groups.
+"""
+
+from azext_iot._params._common import (
+    ArgSpec,
+    _TSF,
+    event_msg_prop_type,
+    _OPTS_INTERFACE,
+    _OPTS_PROPS,
+    _HELP_CONSUMER_GROUP,
+    _HELP_REPAIR,
+)
+
+SPECS = {
+    'iot dt': (
+        ArgSpec('repo_login',
+                opts=('--repo-login', '--rl'),
+                help='This command supports an entity connection string with rights to perform action. Use '
+                     'to avoid PnP endpoint and repository name if repository is private. If both an '
+                     'entity connection string and name are provided the connection string takes priority.'),
+        ArgSpec('interface',
+                opts=_OPTS_INTERFACE,
+                help='Target interface name. This should be the name of the interface not the urn-id.'),
+        ArgSpec('command_name',
+                opts=('--command-name', '--cn'),
+                help='IoT Plug and Play interface command name.'),
+        ArgSpec('command_payload',
+                opts=('--command-payload', '--cp', '--cv'),
+                help='IoT Plug and Play interface command payload. Content can be directly input or '
+                     'extracted from a file path.'),
+        ArgSpec('interface_payload',
+                opts=('--interface-payload', '--ip', '--iv'),
+                help='IoT Plug and Play interface payload. Content can be directly input or extracted from '
+                     'a file path.'),
+        ArgSpec('source_model',
+                opts=('--source', '-s'),
+                help='Choose your option to get model definition from specified source. ',
+                arg_type='ModelSourceType'),
+        ArgSpec('schema',
+                opts=('--schema',),
+                help='Show interface with entity schema.'),
+    ),
+    'iot dt monitor-events': (
+        ArgSpec('consumer_group',
+                opts=('--consumer-group', '--cg'),
+                help=_HELP_CONSUMER_GROUP),
+        ArgSpec('properties',
+                opts=_OPTS_PROPS,
+                arg_type=event_msg_prop_type),
+        ArgSpec('repair',
+                opts=('--repair',),
+                arg_type=_TSF,
+                help=_HELP_REPAIR),
+    ),
+}
@@ -0,0 +1,48 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+
+"""
+Argument specs for iot edge command groups.
+"""
+
+from azext_iot._params._common import (
+    ArgSpec,
+    _OPTS_CONTENT,
+    _OPTS_LABELS,
+    _OPTS_METRICS,
+    _OPTS_PRIORITY,
+    _OPTS_TARGET_CONDITION,
+    _OPTS_TOP,
+)
+
+SPECS = {
+    'iot edge': (
+        ArgSpec('config_id',
+                opts=('--deployment-id', '-d', '--config-id', '-c'),
+                help='Target deployment. --config-id/-c is deprecated for deployments. Use '
+                     '--deployment-id/-d instead.'),
+        ArgSpec('target_condition',
+                opts=_OPTS_TARGET_CONDITION,
+                help='Target condition in which an Edge deployment applies to.'),
+        ArgSpec('priority',
+                opts=_OPTS_PRIORITY,
+                help='Weight of deployment in case of competing rules (highest wins).'),
+        ArgSpec('content',
+                opts=_OPTS_CONTENT,
+                help='IoT Edge deployment content. Provide file path or raw json.'),
+        ArgSpec('metrics',
+                opts=_OPTS_METRICS,
+                help='IoT Edge deployment metric definitions. Provide file path or raw json.'),
+        ArgSpec('labels',
+                opts=_OPTS_LABELS,
+                help='Map of labels to be applied to target deployment. Use the following format: '
+                     '\'{"key0":"value0", "key1":"value1"}\''),
+        ArgSpec('top',
+                opts=_OPTS_TOP,
+                type=int,
+                help='Maximum number of deployments to return.'),
+    ),
+}
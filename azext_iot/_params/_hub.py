@@ -0,0 +1,221 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+
+"""
+Argument specs for iot hub command groups.
+"""
+
+from azext_iot._params._common import (
+    ArgSpec,
+    _TSF,
+    event_msg_prop_type,
+    _OPTS_CHILD_LIST,
+    _OPTS_CONTENT,
+    _OPTS_CONTENT_TYPE,
+    _OPTS_FORCE,
+    _OPTS_LABELS,
+    _OPTS_METRICS,
+    _OPTS_POLICY_NAME,
+    _OPTS_PRIORITY,
+    _OPTS_PROPS,
+    _OPTS_TARGET_CONDITION,
+    _OPTS_TOP,
+    _HELP_CHILD_LIST,
+    _HELP_CONSUMER_GROUP,
+    _HELP_EDGE_DEVICE_ID,
+    _HELP_FORCE_PARENT,
+    _HELP_NON_EDGE_DEVICE_ID,
+)
+
+SPECS = {
+    'iot hub': (
+        ArgSpec('target_json',
+                opts=('--json', '-j'),
+                help='Json to replace existing twin with. Provide file path or raw json.'),
+        ArgSpec('policy_name',
+                opts=_OPTS_POLICY_NAME,
+                help='Shared access policy with operation permissions for target IoT Hub entity.'),
+        ArgSpec('primary_thumbprint',
+                group='X.509',
+                opts=('--primary-thumbprint', '--ptp'),
+                help='Explicit self-signed certificate thumbprint to use for primary key.'),
+        ArgSpec('secondary_thumbprint',
+                group='X.509',
+                opts=('--secondary-thumbprint', '--stp'),
+                help='Explicit self-signed certificate thumbprint to use for secondary key.'),
+        ArgSpec('valid_days',
+                group='X.509',
+                opts=('--valid-days', '--vd'),
+                type=int,
+                help='Generate self-signed cert and use its thumbprint. Valid for specified number of '
+                     'days. Default: 365.'),
+        ArgSpec('output_dir',
+                group='X.509',
+                opts=('--output-dir', '--od'),
+                help='Generate self-signed cert and use its thumbprint. Output to specified target directory'),
+    ),
+    'iot hub monitor-events': (
+        ArgSpec('timeout',
+                opts=('--timeout', '--to', '-t'),
+                type=int,
+                help='Maximum seconds to maintain connection without receiving message. Use 0 for infinity. '),
+        ArgSpec('consumer_group',
+                opts=('--consumer-group', '--cg', '-c'),
+                help=_HELP_CONSUMER_GROUP),
+        ArgSpec('enqueued_time',
+                opts=('--enqueued-time', '--et', '-e'),
+                type=int,
+                help='Indicates the time that should be used as a starting point to read messages from the '
+                     'partitions. Units are milliseconds since unix epoch. If no time is indicated "now" '
+                     'is used.'),
+        ArgSpec('properties',
+                opts=_OPTS_PROPS,
+                arg_type=event_msg_prop_type),
+        ArgSpec('content_type',
+                opts=_OPTS_CONTENT_TYPE,
+                help='Specify the Content-Type of the message payload to automatically format the output '
+                     'to that type.'),
+        ArgSpec('device_query',
+                opts=('--device-query', '-q'),
+                help='Specify a custom query to filter devices.'),
+    ),
+    'iot hub monitor-feedback': (
+        ArgSpec('wait_on_id',
+                opts=('--wait-on-msg', '-w'),
+                help='Feedback monitor will block until a message with specific id (uuid) is received.'),
+    ),
+    'iot hub device-identity': (
+        ArgSpec('edge_enabled',
+                opts=('--edge-enabled', '--ee'),
+                arg_type=_TSF,
+                help='Flag indicating edge enablement.'),
+        ArgSpec('status',
+                opts=('--status', '--sta'),
+                arg_type='EntityStatusType',
+                help='Set device status upon creation.'),
+        ArgSpec('status_reason',
+                opts=('--status-reason', '--star'),
+                help='Description for device status.'),
+    ),
+    'iot hub device-identity create': (
+        ArgSpec('force',
+                opts=_OPTS_FORCE,
+                help=_HELP_FORCE_PARENT),
+        ArgSpec('set_parent_id',
+                opts=('--set-parent', '--pd'),
+                help=_HELP_EDGE_DEVICE_ID),
+        ArgSpec('add_children',
+                opts=('--add-children', '--cl'),
+                help=_HELP_CHILD_LIST),
+    ),
+    'iot hub device-identity export': (
+        ArgSpec('blob_container_uri',
+                opts=('--blob-container-uri', '--bcu'),
+                help='Blob Shared Access Signature URI with write access to a blob container. This is used '
+                     'to output the status of the job and the results.'),
+        ArgSpec('include_keys',
+                opts=('--include-keys', '--ik'),
+                arg_type=_TSF,
+                help='If set, keys are exported normally. Otherwise, keys are set to null in export output.'),
+    ),
+    'iot hub device-identity import': (
+        ArgSpec('input_blob_container_uri',
+                opts=('--input-blob-container-uri', '--ibcu'),
+                help='Blob Shared Access Signature URI with read access to a blob container. This blob '
+                     'contains the operations to be performed on the identity registry '),
+        ArgSpec('output_blob_container_uri',
+                opts=('--output-blob-container-uri', '--obcu'),
+                help='Blob Shared Access Signature URI with write access to a blob container. This is used '
+                     'to output the status of the job and the results.'),
+    ),
+    'iot hub device-identity get-parent': (
+        ArgSpec('device_id',
+                help=_HELP_NON_EDGE_DEVICE_ID),
+    ),
+    'iot hub device-identity set-parent': (
+        ArgSpec('device_id',
+                help=_HELP_NON_EDGE_DEVICE_ID),
+        ArgSpec('parent_id',
+                opts=('--parent-device-id', '--pd'),
+                help=_HELP_EDGE_DEVICE_ID),
+        ArgSpec('force',
+                opts=_OPTS_FORCE,
+                help=_HELP_FORCE_PARENT),
+    ),
+    'iot hub device-identity add-children': (
+        ArgSpec('device_id',
+                help=_HELP_EDGE_DEVICE_ID),
+        ArgSpec('child_list',
+                opts=_OPTS_CHILD_LIST,
+                help=_HELP_CHILD_LIST),
+        ArgSpec('force',
+                opts=_OPTS_FORCE,
+                help=_HELP_FORCE_PARENT),
+    ),
+    'iot hub device-identity remove-children': (
+        ArgSpec('device_id',
+                help=_HELP_EDGE_DEVICE_ID),
+        ArgSpec('child_list',
+                opts=_OPTS_CHILD_LIST,
+                help=_HELP_CHILD_LIST),
+        ArgSpec('remove_all',
+                opts=('--remove-all', '-a'),
+                help='To remove all children.'),
+    ),
+    'iot hub distributed-tracing update': (
+        ArgSpec('sampling_mode',
+                opts=('--sampling-mode', '--sm'),
+                help='Turns sampling for distributed tracing on and off. 1 is On and, 2 is Off.',
+                arg_type='DistributedTracingSamplingModeType'),
+        ArgSpec('sampling_rate',
+                opts=('--sampling-rate', '--sr'),
+                help='Controls the amount of messages sampled for adding trace context. This value isa '
+                     'percentage. Only values from 0 to 100 (inclusive) are permitted.'),
+    ),
+    'iot hub device-identity list-children': (
+        ArgSpec('device_id',
+                help=_HELP_EDGE_DEVICE_ID),
+    ),
+    'iot hub query': (
+        ArgSpec('query_command',
+                opts=('--query-command', '-q'),
+                help='User query to be executed.'),
+        ArgSpec('top',
+                opts=_OPTS_TOP,
+                type=int,
+                help='Maximum number of elements to return. By default query has no cap.'),
+    ),
+    'iot hub apply-configuration': (
+        ArgSpec('content',
+                opts=_OPTS_CONTENT,
+                help='Configuration content. Provide file path or raw json.'),
+    ),
+    'iot hub configuration': (
+        ArgSpec('config_id',
+                opts=('--config-id', '-c'),
+                help='Target device configuration.'),
+        ArgSpec('target_condition',
+                opts=_OPTS_TARGET_CONDITION,
+                help='Target condition in which a device configuration applies to.'),
+        ArgSpec('priority',
+                opts=_OPTS_PRIORITY,
+                help='Weight of the device configuration in case of competing rules (highest wins).'),
+        ArgSpec('content',
+                opts=_OPTS_CONTENT,
+                help='Device configuration content. Provide file path or raw json.'),
+        ArgSpec('metrics',
+                opts=_OPTS_METRICS,
+                help='Device configuration metric definitions. Provide file path or raw json.'),
+        ArgSpec('labels',
+                opts=_OPTS_LABELS,
+                help='Map of labels to be applied to target configuration. Format example: '
+                     '{"key0":"value0", "key1":"value1"}'),
+        ArgSpec('top',
+                opts=_OPTS_TOP,
+                type=int,
+                help='Maximum number of configurations to return.'),
+    ),
+}
@@ -0,0 +1,65 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+
+"""
+Argument specs for iot pnp command groups.
+"""
+
+from azext_iot._params._common import (
+    ArgSpec,
+    _OPTS_DEFINITION,
+    _OPTS_INTERFACE,
+    _OPTS_SEARCH,
+    _OPTS_TOP,
+)
+
+SPECS = {
+    'iot pnp': (
+        ArgSpec('model',
+                opts=('--model', '-m'),
+                help='Target capability-model urn-id. Example: urn:example:capabilityModels:Mxchip:1'),
+        ArgSpec('interface',
+                opts=_OPTS_INTERFACE,
+                help='Target interface urn-id. Example: urn:example:interfaces:MXChip:1'),
+    ),
+    'iot pnp interface': (
+        ArgSpec('interface_definition',
+                opts=_OPTS_DEFINITION,
+                help='IoT Plug and Play interface definition written in PPDL (JSON-LD). Can be directly '
+                     'input or a file path where the content is extracted.'),
+    ),
+    'iot pnp interface list': (
+        ArgSpec('search_string',
+                opts=_OPTS_SEARCH,
+                help='Searches IoT Plug and Play interfaces for given string in the "Description, '
+                     'DisplayName, comment and Id".'),
+        ArgSpec('top',
+                type=int,
+                opts=_OPTS_TOP,
+                help='Maximum number of interface to return.'),
+    ),
+    'iot pnp capability-model': (
+        ArgSpec('model_definition',
+                opts=_OPTS_DEFINITION,
+                help='IoT Plug and Play capability-model definition written in PPDL (JSON-LD). Can be '
+                     'directly input or a file path where the content is extracted.'),
+    ),
+    'iot pnp capability-model show': (
+        ArgSpec('expand',
+                opts=('--expand',),
+                help="Indicates whether to expand the device capability model's interface definitions or not."),
+    ),
+    'iot pnp capability-model list': (
+        ArgSpec('search_string',
+                opts=_OPTS_SEARCH,
+                help='Searches IoT Plug and Play models for given string in the "Description, DisplayName, '
+                     'comment and Id".'),
+        ArgSpec('top',
+                type=int,
+                opts=_OPTS_TOP,
+                help='Maximum number of capability-model to return.'),
+    ),
+}
@@ -0,0 +1,17 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+# cython: language_level=3, boundscheck=False, cdivision=True
+
+"""
+Optional compiled replay loop for azext_iot._params. Built out of band
+(cythonize azext_iot/_params_replay.pyx); the extension falls back to the
+pure-Python loop when the compiled module is absent.
+"""
+
+
+def replay(context, entries, apply_fn):
+    for spec in entries:
+        apply_fn(context, spec)
@@ -9,13 +9,36 @@
 Load CLI commands
 """
 
-from azext_iot import iothub_ops, iotdps_ops, iotdigitaltwin_ops, iotpnp_ops
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def _ops(kind):
+    """
+    Build and cache the CliCommandType for a command group kind.
+    """
+    from azure.cli.core.commands import CliCommandType
+
+    if kind == 'dps':
+        from azext_iot._factory import iot_service_provisioning_factory
+        return CliCommandType(
+            operations_tmpl='azext_iot.operations.dps#{}',
+            client_factory=iot_service_provisioning_factory
+        )
+    return CliCommandType(
+        operations_tmpl='azext_iot.operations.{}#{{}}'.format(kind)
+    )
 
 
 def load_command_table(self, _):
     """
     Load CLI commands
     """
+    iothub_ops = _ops('hub')
+    iotdps_ops = _ops('dps')
+    iotdigitaltwin_ops = _ops('digitaltwin')
+    iotpnp_ops = _ops('pnp')
+
     with self.command_group('iot hub', command_type=iothub_ops) as cmd_group:
         cmd_group.command('query', 'iot_query')
         cmd_group.command('invoke-device-method', 'iot_device_method')
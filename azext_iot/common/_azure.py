@@ -8,7 +8,6 @@
 from knack.util import CLIError
 from azext_iot.common.utility import validate_key_value_pairs
 from azext_iot.common.utility import trim_from_start
-from azext_iot._factory import iot_hub_service_factory
 
 
 def _parse_connection_string(cs, validate=None, cstring_type='entity'):
@@ -92,6 +91,9 @@ def get_iot_hub_connection_string(
 
     client = None
     if getattr(cmd, 'cli_ctx', None):
+        # Deferred so the connection-string parse helpers above do not pull
+        # in the service factory (and its SDK chain) when imported.
+        from azext_iot._factory import iot_hub_service_factory
         client = iot_hub_service_factory(cmd.cli_ctx)
     else:
         client = cmd
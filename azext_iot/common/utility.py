@@ -10,12 +10,19 @@ utility: Define helper functions for 'common' scripts.
 """
 
 import ast
+import atexit
 import contextlib
 import json
 import os
 import sys
+import time
+from functools import lru_cache
 from threading import Event, Thread
-from datetime import datetime
+from urllib.parse import urlencode, quote, quote_plus
+
+# opened once and shared by block_stdout; closed on interpreter exit
+_DEVNULL_FD = os.open(os.devnull, os.O_WRONLY)
+atexit.register(os.close, _DEVNULL_FD)
 
 
 @contextlib.contextmanager
@@ -23,14 +30,14 @@ def block_stdout():
     """
     This function blocks IoT SDK C output. Non-intrusive due to context.
     """
-    devnull = open(os.devnull, 'w')
+    sys.stdout.flush()
     orig_stdout_fno = os.dup(sys.stdout.fileno())
-    os.dup2(devnull.fileno(), 1)
+    os.dup2(_DEVNULL_FD, 1)
     try:
         yield
     finally:
         os.dup2(orig_stdout_fno, 1)
-        devnull.close()
+        os.close(orig_stdout_fno)
 
 
 def parse_entity(entity, filter_none=False):
@@ -44,17 +51,48 @@ def parse_entity(entity, filter_none=False):
         result (dict): a dictionary of attributes from the function input.
     """
     result = {}
-    attributes = [attr for attr in dir(entity) if not attr.startswith('_')]
-    for attribute in attributes:
+    attribute_map = getattr(entity, '_attribute_map', None)
+    if attribute_map:
+        # msrest models declare their public data attributes up front
+        for attribute in attribute_map:
+            value = getattr(entity, attribute, None)
+            if filter_none and not value:
+                continue
+            result[attribute] = value
+        return result
+    attributes = getattr(entity, '__dict__', None)
+    has_properties = any(isinstance(value, property)
+                         for klass in type(entity).__mro__
+                         for value in vars(klass).values())
+    if attributes and not has_properties:
+        for attribute, value in attributes.items():
+            if attribute.startswith('_') or callable(value):
+                continue
+            if filter_none and not value:
+                continue
+            result[attribute] = value
+        if any(not attribute.startswith('_') for attribute in attributes):
+            return result
+    # slotted objects, or ones exposing data fully or partly through
+    # properties over underscore-prefixed backing fields (e.g. uamqp
+    # message properties)
+    for attribute in dir(entity):
+        if attribute.startswith('_'):
+            continue
         value = getattr(entity, attribute, None)
         if filter_none and not value:
             continue
-        value_behavior = dir(value)
-        if '__call__' not in value_behavior:
+        if not callable(value):
             result[attribute] = value
     return result
 
 
+# container literals that must open with a bracket; checked before parsing
+# so impossible inputs skip the AST build. Tuples are excluded since their
+# literals do not require parentheses ('1, 2').
+_LITERAL_PREFIX = {dict: '{', list: '['}
+
+
 # pylint: disable=broad-except
 def evaluate_literal(literal, expected):
     """
@@ -68,6 +106,12 @@ def evaluate_literal(literal, expected):
     Returns:
         result (string, number, tuple, list, dict, boolean, None).
     """
+    if isinstance(literal, str):
+        prefix = _LITERAL_PREFIX.get(expected)
+        if prefix:
+            stripped = literal.lstrip()
+            if not stripped or stripped[0] != prefix:
+                return None
     # Safe evaluation
     try:
         result = ast.literal_eval(literal)
@@ -78,14 +122,21 @@ def evaluate_literal(literal, expected):
         return None
 
 
+@lru_cache(maxsize=256)
+def _jmes(expression):
+    """ Compile (and cache) a jmespath expression - mapping keys are literal
+    constants so repeated validations skip the parser. """
+    import jmespath
+    return jmespath.compile(expression)
+
+
 def verify_transform(subject, mapping):
     """
     Determines if a key from mapping exists in subject and if so
     verifies that subject[k] is of type mapping[k]
     """
-    import jmespath
     for k in mapping.keys():
-        result = jmespath.search(k, subject)
+        result = _jmes(k).search(subject)
 
         if result is None:
             raise AttributeError('The property "{}" is required'.format(k))
@@ -108,10 +159,13 @@ def validate_key_value_pairs(string):
 
     Returns (dict, None): a dictionary of key value pairs.
     """
-    result = None
-    if string:
-        kv_list = [x for x in string.split(';') if '=' in x]     # key-value pairs
-        result = dict(x.split('=', 1) for x in kv_list)
+    if not string:
+        return None
+    result = {}
+    for pair in string.split(';'):
+        key, sep, value = pair.partition('=')
+        if sep:
+            result[key] = value
     return result
 
 
@@ -131,22 +185,33 @@ def shell_safe_json_parse(json_or_dict_string, preserve_order=False):
             raise json_ex
 
 
-def trim_from_start(s, substring):
-    """ Trims a substring from the target string (if it exists) returning the trimmed string.
-    Otherwise returns original target string. """
-    if s.startswith(substring):
-        s = s[len(substring):]
-    return s
+if hasattr(str, 'removeprefix'):
+    def trim_from_start(s, substring):
+        """ Trims a substring from the target string (if it exists) returning the trimmed string.
+        Otherwise returns original target string. """
+        return s.removeprefix(substring)
+else:
+    def trim_from_start(s, substring):
+        """ Trims a substring from the target string (if it exists) returning the trimmed string.
+        Otherwise returns original target string. """
+        if s.startswith(substring):
+            s = s[len(substring):]
+        return s
+
+
+# requested/running version pairs -> bool; the interpreter version cannot
+# change in-process so each comparison only needs evaluating once
+_min_python_checks = {}
 
 
 def validate_min_python_version(major, minor, error_msg=None, exit_on_fail=True):
     """ If python version does not match AT LEAST requested values, will throw non 0 exit code."""
     version = sys.version_info
-    result = False
-    if version.major > major:
-        return True
-    if major == version.major:
-        result = (version.minor >= minor)
+    key = (major, minor, version.major, version.minor)
+    result = _min_python_checks.get(key)
+    if result is None:
+        result = version.major > major or (major == version.major and version.minor >= minor)
+        _min_python_checks[key] = result
 
     if not result:
         if exit_on_fail:
@@ -159,20 +224,12 @@ def validate_min_python_version(major, minor, error_msg=None, exit_on_fail=True)
 
 def unicode_binary_map(target):
     """ Decode binary keys and values of map to unicode."""
-    # Assumes no iteritems()
-    result = {}
-
-    for k in target:
-        key = k
-        if isinstance(k, bytes):
-            key = str(k, 'utf8')
-
-        if isinstance(target[k], bytes):
-            result[key] = str(target[k], 'utf8')
-        else:
-            result[key] = target[k]
-
-    return result
+    decode = bytes.decode
+    return {
+        (decode(k, 'utf8') if isinstance(k, bytes) else k):
+        (decode(v, 'utf8') if isinstance(v, bytes) else v)
+        for k, v in target.items()
+    }
 
 
 def execute_onthread(**kwargs):
@@ -209,12 +266,19 @@ def execute_onthread(**kwargs):
 
     def method_wrap(max_runs=None):
         runs = 0
-        while not cancellation_token.wait(interval):
-            if max_runs:
-                if runs >= max_runs:
-                    break
+        if cancellation_token.wait(interval):
+            return
+        while True:
+            start = time.monotonic()
             method(*method_args)
             runs += 1
+            if max_runs and runs >= max_runs:
+                return
+            # wait out only what the method call left of the interval, so the
+            # tick rate stays accurate and cancellation is picked up sooner
+            elapsed = time.monotonic() - start
+            if cancellation_token.wait(max(0, interval - elapsed)):
+                return
 
     op = Thread(target=method_wrap, args=(max_runs,))
     op.start()
@@ -226,36 +290,28 @@ def execute_onthread(**kwargs):
 
 
 def url_encode_dict(d):
-    try:
-        from urllib import urlencode
-    except ImportError:
-        from urllib.parse import urlencode
-
     return urlencode(d)
 
 
 def url_encode_str(s, plus=False):
-    try:
-        if plus:
-            from urllib import quote_plus
-        else:
-            from urllib import quote
-    except ImportError:
-        if plus:
-            from urllib.parse import quote_plus
-        else:
-            from urllib.parse import quote
-
     return quote_plus(s) if plus else quote(s)
 
 
+# packages that have imported successfully; failures are re-probed since a
+# dependency may be installed mid-session (deps.ensure_uamqp)
+_import_ok = set()
+
+
 def test_import(package):
     """ Used to determine if a dependency is loading correctly """
+    if package in _import_ok:
+        return True
     import importlib
     try:
         importlib.import_module(package)
     except ImportError:
         return False
+    _import_ok.add(package)
     return True
 
 
@@ -272,13 +328,12 @@ def unpack_pnp_http_error(e):
 def unpack_msrest_error(e, clouderror=True):
     """ Obtains full response text from an msrest error """
     if clouderror:
-        op_err = None
         try:
-            op_err = json.loads(e.response.text)
-        except ValueError:
-            op_err = e.response.text
-        except TypeError:
-            op_err = e.response.text
+            # parses response bytes directly, avoiding the charset-detected
+            # str copy that .text would produce
+            op_err = e.response.json()
+        except (ValueError, TypeError, AttributeError):
+            op_err = getattr(e.response, 'text', None)
         if not op_err:
             return str(e)
         return op_err
@@ -291,24 +346,28 @@ def dict_transform_lower_case_key(d):
 
 
 def calculate_millisec_since_unix_epoch_utc():
-    now = datetime.utcnow()
-    epoch = datetime.utcfromtimestamp(0)
-    return int(1000 * (now - epoch).total_seconds())
+    return int(time.time() * 1000)
 
 
 def get_sas_token(target):
+    repository_id = target.get('repository_id')
+    if not repository_id:
+        return {'Authorization': ''}
     from azext_iot.common.digitaltwin_sas_token_auth import DigitalTwinSasTokenAuthentication
-    token = ''
-    if target.get('repository_id'):
-        token = DigitalTwinSasTokenAuthentication(target["repository_id"],
-                                                  target["entity"],
-                                                  target["policy"],
-                                                  target["primarykey"]).generate_sas_token()
-    return {'Authorization': '{}'.format(token)}
+    token = DigitalTwinSasTokenAuthentication(repository_id,
+                                              target['entity'],
+                                              target['policy'],
+                                              target['primarykey']).generate_sas_token()
+    return {'Authorization': token}
 
 
 def dict_clean(d):
     """ Remove None from dictionary """
     if not isinstance(d, dict):
         return d
-    return dict((k, dict_clean(v)) for k, v in d.items() if v is not None)
+    result = {}
+    for k, v in d.items():
+        if v is None:
+            continue
+        result[k] = dict_clean(v) if isinstance(v, dict) else v
+    return result
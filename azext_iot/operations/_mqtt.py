@@ -8,16 +8,27 @@
 
 import ssl
 import os
-import six
+import sys
 
+from threading import Event
 from time import time, sleep
+from knack.util import CLIError
 from paho.mqtt import client as mqtt
 
 from azext_iot._constants import EXTENSION_ROOT
 from azext_iot.common.sas_token_auth import SasTokenAuthentication
 
-connection_result = {0: "success", 1: "refused - incorrect protocol version", 2: "refused - invalid client id",
-                     3: "refused - server unavailable", 4: "refused - bad username or password", 5: "refused - not authorized"}
+# CONNACK return codes are a dense 0..5 range; indexed, not hashed
+connection_result = ("success", "refused - incorrect protocol version", "refused - invalid client id",
+                     "refused - server unavailable", "refused - bad username or password", "refused - not authorized")
+
+# The CA bundle is fixed for the extension; parse it once per process so
+# multi-device simulations do not re-read digicert.pem per client.
+# CERT_REQUIRED matches what tls_set(ca_certs=...) enforced; paho handles
+# hostname matching itself post-handshake.
+_SSL_CTX = ssl.SSLContext(ssl.PROTOCOL_SSLv23)
+_SSL_CTX.verify_mode = ssl.CERT_REQUIRED
+_SSL_CTX.load_verify_locations(os.path.join(EXTENSION_ROOT, 'digicert.pem'))
 
 
 class mqtt_client_wrap(object):
@@ -27,52 +38,50 @@ class mqtt_client_wrap(object):
         self.device_id = device_id
 
         sas = SasTokenAuthentication(target['entity'], target['policy'], target['primarykey'], time() + 360).generate_sas_token()
-        cwd = EXTENSION_ROOT
-        cert_path = os.path.join(cwd, 'digicert.pem')
-        auth = {'username': '{}/{}/api-version=2016-11-14'.format(target['entity'], device_id), 'password': sas}
-        tls = {'ca_certs': cert_path, 'tls_version': ssl.PROTOCOL_SSLv23}
+        username = '{}/{}/api-version=2016-11-14'.format(target['entity'], device_id)
         self.topic_publish = 'devices/{}/messages/events/'.format(device_id)
         self.topic_receive = 'devices/{}/messages/devicebound/#'.format(device_id)
         self.connected = False
+        self._ready = Event()
 
         self.client = mqtt.Client(protocol=mqtt.MQTTv311, client_id=device_id)
         self.client.on_connect = self.on_connect
         self.client.on_message = self.on_message
         self.client.on_publish = self.on_publish
-        self.client.tls_set(ca_certs=tls['ca_certs'], tls_version=tls['tls_version'])
-        self.client.username_pw_set(username=auth['username'], password=sas)
+        self.client.tls_set_context(_SSL_CTX)
+        self.client.username_pw_set(username=username, password=sas)
         self.client.connect(host=self.target['entity'], port=8883)
 
     def on_connect(self, client, userdata, flags, rc):
-        six.print_("Connected to target IoT Hub MQTT broker with result: {}".format(connection_result[rc]))
+        result = connection_result[rc] if 0 <= rc < len(connection_result) else 'rc={}'.format(rc)
+        print("Connected to target IoT Hub MQTT broker with result: {}".format(result), flush=True)
         self.client.subscribe(self.topic_receive)
-        six.print_("Subscribed to device bound message queue")
+        print("Subscribed to device bound message queue", flush=True)
         self.connected = True
+        self._ready.set()
 
     def on_message(self, client, userdata, msg):
-        six.print_()
-        six.print_("_Received C2D message with topic_: {}".format(msg.topic))
-        six.print_("_Payload_: {}".format(msg.payload))
+        print(flush=True)
+        print("_Received C2D message with topic_: {}".format(msg.topic), flush=True)
+        print("_Payload_: {}".format(msg.payload), flush=True)
 
     def on_publish(self, client, userdata, mid):
-        six.print_('.', end='', flush=True)
+        sys.stdout.write('.')
+        sys.stdout.flush()
 
     def is_connected(self):
         return self.connected
 
     def execute(self, data, publish_delay=2, msg_count=100):
         try:
-            msgs = 0
             self.client.loop_start()
-            while True:
-                if self.is_connected():
-                    if msgs < msg_count:
-                        msgs += 1
-                        self.client.publish(self.topic_publish, data.generate(True))
-                    else:
-                        break
-                sleep(publish_delay)
-        except Exception as x:
-            raise x
+            # Publishing waits on the broker CONNACK instead of polling
+            # is_connected() with mandatory sleeps between checks.
+            if not self._ready.wait(timeout=30):
+                raise CLIError('Timed out waiting for MQTT connection to {}.'.format(self.target['entity']))
+            for _ in range(msg_count):
+                self.client.publish(self.topic_publish, data.generate(True), qos=0)
+                if publish_delay:
+                    sleep(publish_delay)
         finally:
             self.client.loop_stop()
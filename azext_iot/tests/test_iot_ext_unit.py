@@ -1848,8 +1848,8 @@ class TestDeviceSimulate():
     @pytest.fixture()
     def mqttclient(self, mocker, fixture_ghcs, fixture_sas):
         client = mocker.patch(path_mqtt_client)
-        mock_conn = mocker.patch('azext_iot.operations._mqtt.mqtt_client_wrap.is_connected')
-        mock_conn.return_value = True
+        mock_ready = mocker.patch('azext_iot.operations._mqtt.Event')
+        mock_ready().wait.return_value = True
         return client
 
     @pytest.mark.parametrize("rs, mc, mi, protocol", [
@@ -1873,9 +1873,18 @@ class TestDeviceSimulate():
         if protocol == 'mqtt':
             assert mc == mqttclient().publish.call_count
             assert mqttclient().publish.call_args[0][0] == 'devices/{}/messages/events/'.format(device_id)
-            assert mqttclient().tls_set.call_count == 1
+            assert mqttclient().tls_set_context.call_count == 1
             assert mqttclient().username_pw_set.call_count == 1
 
+    def test_device_simulate_mqtt_connect_timeout(self, serviceclient, mocker, fixture_ghcs, fixture_sas):
+        mocker.patch(path_mqtt_client)
+        mock_ready = mocker.patch('azext_iot.operations._mqtt.Event')
+        mock_ready().wait.return_value = False
+        with pytest.raises(CLIError):
+            subject.iot_simulate_device(fixture_cmd, device_id, mock_target['entity'],
+                                        receive_settle='complete', msg_count=1, msg_interval=1,
+                                        protocol_type='mqtt')
+
     @pytest.mark.parametrize("rs, mc, mi, protocol, exception", [
         ('reject', 4, 0, 'mqtt', CLIError),
         ('complete', 0, 1, 'mqtt', CLIError)
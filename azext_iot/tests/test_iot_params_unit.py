@@ -0,0 +1,123 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+
+from importlib import import_module
+
+import pytest
+from azext_iot import _params
+from azext_iot._params import _common
+
+# context.argument calls made by the monolithic _params.py before the
+# per-group split; the spec tables must keep replaying the same set.
+BASELINE_ARG_COUNT = 134
+
+
+class RecordingContext(object):
+    def __init__(self, scope, registrations):
+        self.scope = scope
+        self.registrations = registrations
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def argument(self, name, **kwargs):
+        self.registrations.append((self.scope, name, kwargs))
+
+
+class RecordingLoader(object):
+    def __init__(self):
+        self.registrations = []
+
+    def argument_context(self, scope):
+        return RecordingContext(scope, self.registrations)
+
+
+def all_specs():
+    specs = dict(_common.SPECS)
+    for name in _params._GROUP_MODULES.values():
+        specs.update(import_module('azext_iot._params.' + name).SPECS)
+    return specs
+
+
+@pytest.fixture()
+def no_manifest(mocker):
+    mocker.patch.object(_params, '_manifest', None)
+    mocker.patch.object(_params, '_manifest_checked', True)
+
+
+class TestScopeApplies():
+    @pytest.mark.parametrize("scope, command, expected", [
+        ('iot', 'iot hub device-identity create', True),
+        ('iot hub', 'iot hub device-identity create', True),
+        ('iot hub device-identity', 'iot hub', True),
+        ('iot dps', 'iot hub device-identity create', False),
+        ('iot dps enrollment', 'iot dps enrollment create', True),
+        ('iot hub monitor-events', 'iot dt monitor-events', False),
+    ])
+    def test_scope_applies(self, scope, command, expected):
+        assert _params._scope_applies(scope, command) == expected
+
+
+class TestLoadArguments():
+    def test_load_all_without_command(self, no_manifest):
+        loader = RecordingLoader()
+        _params.load_arguments(loader, None)
+
+        specs = all_specs()
+        assert set(s for s, _, _ in loader.registrations) == set(specs)
+        assert len(loader.registrations) == sum(len(entries) for entries in specs.values())
+        assert len(loader.registrations) == BASELINE_ARG_COUNT
+
+        by_key = {(s, n): kwargs for s, n, kwargs in loader.registrations}
+        assert by_key[('iot', 'login')]['options_list'] == ('--login', '-l')
+        assert callable(by_key[('iot', 'login')]['validator'])
+        assert by_key[('iot', 'top')]['type'] is int
+
+    def test_load_scoped_command(self, no_manifest):
+        loader = RecordingLoader()
+        _params.load_arguments(loader, 'iot dps enrollment create')
+
+        scopes = set(s for s, _, _ in loader.registrations)
+        assert 'iot' in scopes
+        assert 'iot dps enrollment create' in scopes
+        assert not any(s.startswith('iot hub') for s in scopes)
+
+    def test_load_memoized_per_loader_command(self, no_manifest):
+        loader = RecordingLoader()
+        _params.load_arguments(loader, 'iot hub show-connection-string')
+        count = len(loader.registrations)
+        assert count
+
+        _params.load_arguments(loader, 'iot hub show-connection-string')
+        assert len(loader.registrations) == count
+
+        _params.load_arguments(loader, 'iot dps enrollment create')
+        assert len(loader.registrations) > count
+
+    def test_manifest_replay_matches_source(self, mocker):
+        refs = {id(obj): name for name, obj in _common._refs().items()}
+        manifest = {}
+        for scope, entries in all_specs().items():
+            frozen = []
+            for spec in entries:
+                updates = {field: ('$ref', refs[id(value)])
+                           for field, value in zip(spec._fields, spec) if id(value) in refs}
+                frozen.append(spec._replace(**updates) if updates else spec)
+            manifest[scope] = tuple(frozen)
+
+        source_loader = RecordingLoader()
+        mocker.patch.object(_params, '_manifest', None)
+        mocker.patch.object(_params, '_manifest_checked', True)
+        _params.load_arguments(source_loader, None)
+
+        manifest_loader = RecordingLoader()
+        mocker.patch.object(_params, '_manifest', manifest)
+        _params.load_arguments(manifest_loader, None)
+
+        assert manifest_loader.registrations == source_loader.registrations
@@ -1,6 +1,7 @@
 import pytest
 from knack.util import CLIError
-from azext_iot.common.utility import validate_min_python_version
+from azext_iot.common.utility import (execute_onthread, parse_entity,
+                                      validate_min_python_version)
 from azext_iot.common.deps import ensure_uamqp
 from azext_iot._validators import mode2_iot_login_handler
 from azext_iot._constants import EVENT_LIB
@@ -131,3 +132,78 @@ class TestEnsureUamqp():
             install_args = uamqp_scenario['installer'].call_args
             assert install_args[0][0] == EVENT_LIB[0]
             assert install_args[1]['custom_version'] == '>={},<{}'.format(EVENT_LIB[1], EVENT_LIB[2])
+
+
+class TestParseEntity():
+    def test_parse_entity_attribute_map(self):
+        class entity(object):
+            _attribute_map = {'alpha': {}, 'beta': {}}
+
+            def __init__(self):
+                self.alpha = 'a'
+                self.beta = None
+
+        assert parse_entity(entity()) == {'alpha': 'a', 'beta': None}
+        assert parse_entity(entity(), True) == {'alpha': 'a'}
+
+    def test_parse_entity_instance_dict(self):
+        class entity(object):
+            def __init__(self):
+                self.alpha = 'a'
+                self.beta = None
+                self._hidden = 'h'
+
+        assert parse_entity(entity()) == {'alpha': 'a', 'beta': None}
+        assert parse_entity(entity(), True) == {'alpha': 'a'}
+
+    def test_parse_entity_property_backed(self):
+        # uamqp message properties keep state in underscore-prefixed fields
+        # exposed through properties
+        class entity(object):
+            def __init__(self):
+                self._content_type = 'application/json'
+                self._correlation_id = None
+
+            @property
+            def content_type(self):
+                return self._content_type
+
+            @property
+            def correlation_id(self):
+                return self._correlation_id
+
+        assert parse_entity(entity()) == {'content_type': 'application/json',
+                                          'correlation_id': None}
+        assert parse_entity(entity(), True) == {'content_type': 'application/json'}
+
+    def test_parse_entity_mixed_property_backed(self):
+        class entity(object):
+            def __init__(self):
+                self.alpha = 'a'
+                self._beta = 'b'
+
+            @property
+            def beta(self):
+                return self._beta
+
+        assert parse_entity(entity()) == {'alpha': 'a', 'beta': 'b'}
+
+
+class TestExecuteOnthread():
+    def test_execute_onthread_max_runs(self):
+        calls = []
+        token, op = execute_onthread(method=lambda: calls.append(1),
+                                     interval=0.1, max_runs=3, return_handle=True)
+        op.join(5)
+        assert not op.is_alive()
+        assert len(calls) == 3
+        token.set()
+
+    def test_execute_onthread_cancellation(self):
+        calls = []
+        token, op = execute_onthread(method=lambda: calls.append(1),
+                                     interval=5, return_handle=True)
+        token.set()
+        op.join(2)
+        assert not op.is_alive()
+        assert not calls
@@ -0,0 +1,54 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+
+"""
+Freeze the azext_iot._params argument specs into params_manifest.pkl.
+
+The Python table in _params.py stays the source of truth; run this during a
+build to ship a serialized manifest that load_arguments replays with a single
+file read instead of evaluating the table source. Objects that cannot be
+pickled by value are stored as ('$ref', name) markers resolved at replay.
+"""
+
+import os
+import pickle
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from importlib import import_module  # noqa: E402 pylint: disable=wrong-import-position
+
+from azext_iot import _params  # noqa: E402 pylint: disable=wrong-import-position
+from azext_iot._params import _common  # noqa: E402 pylint: disable=wrong-import-position
+
+
+def _all_specs():
+    specs = dict(_common.SPECS)
+    for name in _params._GROUP_MODULES.values():  # pylint: disable=protected-access
+        specs.update(import_module('azext_iot._params.' + name).SPECS)
+    return specs
+
+
+def generate(target_dir):
+    refs = {id(obj): name for name, obj in _common._refs().items()}  # pylint: disable=protected-access
+    manifest = {}
+    for scope, entries in _all_specs().items():
+        frozen = []
+        for spec in entries:
+            updates = {field: ('$ref', refs[id(value)])
+                       for field, value in zip(spec._fields, spec) if id(value) in refs}
+            frozen.append(spec._replace(**updates) if updates else spec)
+        manifest[scope] = tuple(frozen)
+    target = os.path.join(target_dir, _params._MANIFEST_FILE)  # pylint: disable=protected-access
+    with open(target, 'wb') as handle:
+        pickle.dump(manifest, handle, protocol=2)
+    return target
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        sys.exit('usage: gen_params_manifest.py <target directory>')
+    print('Wrote {}'.format(generate(sys.argv[1])))
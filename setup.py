@@ -7,8 +7,12 @@
 
 import re
 import os.path
+import subprocess
+import sys
 from io import open  # pylint: disable=W0622
 from setuptools import setup, find_packages
+from setuptools.command.build_py import build_py as _build_py
+from setuptools.command.install import install as _install
 
 
 package_folder_path = "azext_iot"
@@ -25,12 +29,7 @@ CLASSIFIERS = [
     "Intended Audience :: Developers",
     "Intended Audience :: System Administrators",
     "Programming Language :: Python",
-    "Programming Language :: Python :: 2",
-    "Programming Language :: Python :: 2.7",
     "Programming Language :: Python :: 3",
-    "Programming Language :: Python :: 3.4",
-    "Programming Language :: Python :: 3.5",
-    "Programming Language :: Python :: 3.6",
     "Programming Language :: Python :: 3.7",
     "License :: OSI Approved :: MIT License",
 ]
@@ -51,6 +50,42 @@ CLASSIFIERS = [
 DEPENDENCIES = ["paho-mqtt==1.3.1", "jsonschema~=3.0.2"]
 
 
+class build_py(_build_py):  # pylint: disable=invalid-name
+    """
+    Standard build plus generation of the argument-spec manifest replayed by
+    azext_iot._params.load_arguments. The pickle is written into build_lib
+    only, so source checkouts keep evaluating the live spec tables.
+    Generation needs the CLI dependencies importable; when they are not,
+    the build proceeds without the manifest and the specs are evaluated
+    from source at runtime.
+    """
+
+    def run(self):
+        _build_py.run(self)
+        script = os.path.join(
+            os.path.dirname(os.path.abspath(__file__)), "scripts", "gen_params_manifest.py"
+        )
+        target_dir = os.path.join(self.build_lib, package_folder_path)
+        if subprocess.call([sys.executable, script, target_dir]) != 0:
+            self.warn("params manifest not generated; argument specs will load from source")
+
+
+class install(_install):  # pylint: disable=invalid-name
+    """
+    Standard install plus bytecode pre-compilation, so cold CLI starts load
+    a cached .pyc instead of parsing source. Wheel installs get the same
+    treatment from pip's own post-install byte-compilation; this covers
+    direct `setup.py install` runs.
+    """
+
+    def run(self):
+        _install.run(self)
+        import compileall
+        compileall.compile_dir(
+            os.path.join(self.install_lib, package_folder_path), quiet=1
+        )
+
+
 setup(
     name="azure-cli-iot-ext",
     version=VERSION,
@@ -63,6 +98,17 @@ setup(
     url="https://github.com/azure/azure-iot-cli-extension",
     classifiers=CLASSIFIERS,
     packages=find_packages(exclude=["tests", "tests.*", "scripts"]),
-    package_data={"azext_iot": ["azext_metadata.json", "digicert.pem", "assets/edge-deploy-2.0.schema.json"]},
+    package_data={
+        "azext_iot": [
+            "azext_metadata.json",
+            "digicert.pem",
+            "assets/edge-deploy-2.0.schema.json",
+            # generated by the build_py hook via scripts/gen_params_manifest.py
+            "params_manifest.pkl",
+        ]
+    },
     install_requires=DEPENDENCIES,
+    # PEP 562 module __getattr__ in azext_iot/__init__.py needs 3.7+
+    python_requires=">=3.7",
+    cmdclass={"build_py": build_py, "install": install},
 )